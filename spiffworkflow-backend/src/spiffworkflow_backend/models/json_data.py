@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import json
+import re
 from hashlib import sha256
+from typing import Any
 from typing import TypedDict
 
 from flask import current_app
@@ -11,6 +13,10 @@ from sqlalchemy.dialects.postgresql import insert as postgres_insert
 from spiffworkflow_backend.models.db import SpiffworkflowBaseDBModel
 from spiffworkflow_backend.models.db import db
 
+# json path keys that can be passed to the db as is. sqlalchemy does not escape the keys in a json path
+# so things like quotes, commas, and braces would change or break the path on mysql and postgres.
+SAFE_JSON_PATH_KEY_REGEX = re.compile(r"[A-Za-z_][A-Za-z0-9_.-]*")
+
 
 class JsonDataModelNotFoundError(Exception):
     pass
@@ -60,6 +66,24 @@ class JsonDataModel(SpiffworkflowBaseDBModel):
     def find_data_dict_by_hash(cls, hash: str) -> dict:
         return cls.find_object_by_hash(hash).data
 
+    # extracts a single value from the data column in the db so we do not have to load and parse the whole dict.
+    # returns None if the path does not exist in the data.
+    # keys that are not safe to put in a json path fall back to loading the whole dict.
+    @classmethod
+    def find_data_value_by_hash(cls, hash: str, path: tuple[str, ...]) -> Any:
+        if not all(SAFE_JSON_PATH_KEY_REGEX.fullmatch(key) for key in path):
+            value: Any = cls.find_data_dict_by_hash(hash)
+            for key in path:
+                if not isinstance(value, dict):
+                    return None
+                value = value.get(key)
+            return value
+
+        result = db.session.query(JsonDataModel.data[path]).filter_by(hash=hash).first()
+        if result is None:
+            raise JsonDataModelNotFoundError(f"Could not find a json data model entry with hash: {hash}")
+        return result[0]
+
     @classmethod
     def insert_or_update_json_data_records(cls, json_data_hash_to_json_data_dict_mapping: dict[str, JsonDataDict]) -> None:
         list_of_dicts = [*json_data_hash_to_json_data_dict_mapping.values()]
@@ -1,3 +1,4 @@
+import functools
 import json
 
 import redis
@@ -17,7 +18,14 @@ def test_raise_error() -> Response:
 
 
 def version_info() -> Response:
-    return make_response(get_version_info_data(), 200)
+    return Response(_version_info_json(), status=200, mimetype="application/json")
+
+
+# version_info.json is written at build time and does not change while the app is running
+# so only read and serialize it once per process.
+@functools.lru_cache(maxsize=1)
+def _version_info_json() -> str:
+    return json.dumps(get_version_info_data())
 
 
 # this is just to see what the protocol is, primarily. if the site is running on https in the browser, but this says "http://something.example.com",
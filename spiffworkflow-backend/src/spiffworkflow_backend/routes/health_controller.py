@@ -1,9 +1,11 @@
 from flask import make_response
 from flask.wrappers import Response
+from sqlalchemy import text
 
-from spiffworkflow_backend.models.process_instance import ProcessInstanceModel
+from spiffworkflow_backend.models.db import db
 
 
 def status() -> Response:
-    ProcessInstanceModel.query.filter().first()
+    # only prove that the db is reachable. there is no need to pull back and hydrate a whole process instance row to do that.
+    db.session.execute(text("select 1")).scalar()
     return make_response({"ok": True}, 200)
@@ -14,8 +14,9 @@ from flask import make_response
 from flask.wrappers import Response
 from SpiffWorkflow.task import Task as SpiffTask  # type: ignore
 from SpiffWorkflow.util.task import TaskState  # type: ignore
-from sqlalchemy import and_
+from sqlalchemy import exists
 from sqlalchemy import or_
+from sqlalchemy.orm import load_only
 
 from spiffworkflow_backend.background_processing.celery_tasks.process_instance_task_producer import (
     queue_enabled_for_process_model,
@@ -35,6 +36,7 @@ from spiffworkflow_backend.models.db import db
 from spiffworkflow_backend.models.human_task import HumanTaskModel
 from spiffworkflow_backend.models.human_task_user import HumanTaskUserModel
 from spiffworkflow_backend.models.json_data import JsonDataModel
+from spiffworkflow_backend.models.json_data import JsonDataModelNotFoundError
 from spiffworkflow_backend.models.principal import PrincipalModel
 from spiffworkflow_backend.models.process_instance import ProcessInstanceModel
 from spiffworkflow_backend.models.process_instance import ProcessInstanceStatus
@@ -80,25 +82,55 @@ def permissions_check(body: dict[str, dict[str, list[str]]]) -> flask.wrappers.R
                 status_code=400,
             )
         )
-    response_dict: dict[str, dict[str, bool]] = {}
     requests_to_check = body["requests_to_check"]
+    if not isinstance(requests_to_check, dict) or not all(
+        isinstance(http_methods, list) and all(isinstance(http_method, str) for http_method in http_methods)
+        for http_methods in requests_to_check.values()
+    ):
+        raise (
+            ApiError(
+                error_code="invalid_requests_to_check",
+                message="The value of 'requests_to_check' must map each target uri to a list of http methods.",
+                status_code=400,
+            )
+        )
 
-    user = g.user
-    permission_assignments = AuthorizationService.all_permission_assignments_for_user(user=user)
-
+    # map each http method to its permission once, dropping duplicate http methods and ones that do not map
+    # to a permission before touching the db. methods that do not map to a permission have never been included in the results.
+    permissions_by_http_method_by_target_uri: dict[str, dict[str, str]] = {}
     for target_uri, http_methods in requests_to_check.items():
-        if target_uri not in response_dict:
-            response_dict[target_uri] = {}
-
-        for http_method in http_methods:
+        permissions_by_http_method_by_target_uri[target_uri] = {}
+        for http_method in dict.fromkeys(http_methods):
             permission_string = AuthorizationService.get_permission_from_http_method(http_method)
             if permission_string:
-                has_permission = AuthorizationService.permission_assignments_include(
-                    permission_assignments=permission_assignments,
-                    permission=permission_string,
-                    target_uri=target_uri,
-                )
-                response_dict[target_uri][http_method] = has_permission
+                permissions_by_http_method_by_target_uri[target_uri][http_method] = permission_string
+
+    response_dict: dict[str, dict[str, bool]] = {}
+    if len(permissions_by_http_method_by_target_uri) == 0:
+        return make_response(jsonify({"results": response_dict}), 200)
+
+    user = g.user
+    permission_assignments = AuthorizationService.all_permission_assignments_for_user(user=user)
+
+    # users like super admins can do everything so there is no need to check each uri
+    if AuthorizationService.permission_assignments_grant_everything(permission_assignments):
+        response_dict = {
+            target_uri: {http_method: True for http_method in permissions_by_http_method}
+            for target_uri, permissions_by_http_method in permissions_by_http_method_by_target_uri.items()
+        }
+        return make_response(jsonify({"results": response_dict}), 200)
+
+    permission_assignments_by_permission = AuthorizationService.permission_assignments_by_permission(permission_assignments)
+
+    for target_uri, permissions_by_http_method in permissions_by_http_method_by_target_uri.items():
+        response_dict[target_uri] = {}
+        target_uri_normalized = AuthorizationService.normalize_target_uri(target_uri)
+        for http_method, permission_string in permissions_by_http_method.items():
+            response_dict[target_uri][http_method] = AuthorizationService.permission_assignments_include_normalized_uri(
+                permission_assignments=permission_assignments_by_permission.get(permission_string, []),
+                permission=permission_string,
+                target_uri_normalized=target_uri_normalized,
+            )
 
     return make_response(jsonify({"results": response_dict}), 200)
 
@@ -110,17 +142,18 @@ def process_list() -> Any:
     primary process - helpful for finding possible call activities.
     """
     references = ReferenceCacheModel.basic_query().filter_by(type="process").all()
-    process_model_identifiers = [r.relative_location for r in references]
-    permitted_process_model_identifiers = ProcessModelService.process_model_identifiers_with_permission_for_user(
-        user=g.user,
-        permission_to_check="create",
-        permission_base_uri="/v1.0/process-instances",
-        process_model_identifiers=process_model_identifiers,
+
+    # a process model can define many processes so only check permissions once per process model
+    process_model_identifiers = list(dict.fromkeys(r.relative_location for r in references))
+    permitted_process_model_identifiers = set(
+        ProcessModelService.process_model_identifiers_with_permission_for_user(
+            user=g.user,
+            permission_to_check="create",
+            permission_base_uri="/v1.0/process-instances",
+            process_model_identifiers=process_model_identifiers,
+        )
     )
-    permitted_references = []
-    for spec_reference in references:
-        if spec_reference.relative_location in permitted_process_model_identifiers:
-            permitted_references.append(spec_reference)
+    permitted_references = [r for r in references if r.relative_location in permitted_process_model_identifiers]
     return ReferenceSchema(many=True).dump(permitted_references)
 
 
@@ -156,16 +189,14 @@ def _get_data_object_from_bpmn_process(
     bpmn_process_guid: str | None,
     process_instance: ProcessInstanceModel,
 ) -> Any:
-    bpmn_process_data = JsonDataModel.find_data_dict_by_hash(bpmn_process.json_data_hash)
-    if bpmn_process_data is None:
+    try:
+        return JsonDataModel.find_data_value_by_hash(bpmn_process.json_data_hash, ("data_objects", process_data_identifier))
+    except JsonDataModelNotFoundError as exception:
         raise ApiError(
             error_code="bpmn_process_data_not_found",
             message=f"Cannot find a bpmn process data with guid '{bpmn_process_guid}' for process instance {process_instance.id}",
             status_code=404,
-        )
-
-    data_objects = bpmn_process_data.get("data_objects", {})
-    return data_objects.get(process_data_identifier)
+        ) from exception
 
 
 def _process_data_fetcher(
@@ -323,10 +354,15 @@ def _un_modify_modified_process_model_id(modified_process_model_identifier: str)
     return modified_process_model_identifier.replace(":", "/")
 
 
+# pass load_columns when the caller only needs a few columns (like the id) to avoid loading the whole row
 def _find_process_instance_by_id_or_raise(
     process_instance_id: int,
+    *,
+    load_columns: tuple[Any, ...] | None = None,
 ) -> ProcessInstanceModel:
     process_instance_query = ProcessInstanceModel.query.filter_by(id=process_instance_id)
+    if load_columns is not None:
+        process_instance_query = process_instance_query.options(load_only(*load_columns))
 
     # we had a frustrating session trying to do joins and access columns from two tables. here's some notes for our future selves:
     # this returns an object that allows you to do: process_instance.UserModel.username
@@ -368,38 +404,48 @@ def _get_process_model(process_model_id: str) -> ProcessModelInfo:
 def _find_principal_or_raise() -> PrincipalModel:
     principal = PrincipalModel.query.filter_by(user_id=g.user.id).first()
     if principal is None:
-        raise (
-            ApiError(
-                error_code="principal_not_found",
-                message=f"Principal not found from user id: {g.user.id}",
-                status_code=400,
-            )
-        )
+        raise _principal_not_found_error(g.user.id)
     return principal  # type: ignore
 
 
+# use this instead of _find_principal_or_raise when the principal model itself is not needed
+# since it only checks for a row and does not add a principal to the session.
+def _ensure_principal_exists_or_raise() -> None:
+    if not db.session.query(exists().where(PrincipalModel.user_id == g.user.id)).scalar():
+        raise _principal_not_found_error(g.user.id)
+
+
+def _principal_not_found_error(user_id: int) -> ApiError:
+    return ApiError(
+        error_code="principal_not_found",
+        message=f"Principal not found from user id: {user_id}",
+        status_code=400,
+    )
+
+
 def _find_process_instance_for_me_or_raise(
     process_instance_id: int,
     include_actions: bool = False,
 ) -> ProcessInstanceModel:
+    # use correlated EXISTS subqueries rather than outer joining human tasks so the db can stop at the first
+    # matching human task instead of fanning out across every human task on the process instance.
     process_instance: ProcessInstanceModel | None = (
         ProcessInstanceModel.query.filter_by(id=process_instance_id)
-        .outerjoin(HumanTaskModel)
-        .outerjoin(
-            HumanTaskUserModel,
-            and_(
-                HumanTaskModel.id == HumanTaskUserModel.human_task_id,
-                HumanTaskUserModel.user_id == g.user.id,
-            ),
-        )
         .filter(
             or_(
-                # you were allowed to complete it
-                HumanTaskUserModel.id.is_not(None),
-                # or you completed it (which admins can do even if it wasn't assigned via HumanTaskUserModel)
-                HumanTaskModel.completed_by_user_id == g.user.id,
-                # or you started it
+                # you started it
                 ProcessInstanceModel.process_initiator_id == g.user.id,
+                # or you were allowed to complete it
+                exists().where(
+                    HumanTaskModel.process_instance_id == ProcessInstanceModel.id,
+                    HumanTaskUserModel.human_task_id == HumanTaskModel.id,
+                    HumanTaskUserModel.user_id == g.user.id,
+                ),
+                # or you completed it (which admins can do even if it wasn't assigned via HumanTaskUserModel)
+                exists().where(
+                    HumanTaskModel.process_instance_id == ProcessInstanceModel.id,
+                    HumanTaskModel.completed_by_user_id == g.user.id,
+                ),
             )
         )
         .first()
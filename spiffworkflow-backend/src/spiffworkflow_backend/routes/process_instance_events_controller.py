@@ -8,6 +8,7 @@ from sqlalchemy import and_
 from spiffworkflow_backend.exceptions.api_error import ApiError
 from spiffworkflow_backend.models.bpmn_process_definition import BpmnProcessDefinitionModel
 from spiffworkflow_backend.models.db import db
+from spiffworkflow_backend.models.process_instance import ProcessInstanceModel
 from spiffworkflow_backend.models.process_instance_event import ProcessInstanceEventModel
 from spiffworkflow_backend.models.process_instance_event import ProcessInstanceEventType
 from spiffworkflow_backend.models.process_instance_migration_detail import ProcessInstanceMigrationDetailModel
@@ -28,7 +29,7 @@ def log_list(
     task_type: str | None = None,
     event_type: str | None = None,
 ) -> flask.wrappers.Response:
-    process_instance = _find_process_instance_by_id_or_raise(process_instance_id)
+    process_instance = _find_process_instance_by_id_or_raise(process_instance_id, load_columns=(ProcessInstanceModel.id,))
 
     log_query = (
         ProcessInstanceEventModel.query.filter_by(process_instance_id=process_instance.id)
@@ -100,7 +101,7 @@ def typeahead_filter_values(
     process_instance_id: int,
     task_type: str | None = None,
 ) -> flask.wrappers.Response:
-    process_instance = _find_process_instance_by_id_or_raise(process_instance_id)
+    process_instance = _find_process_instance_by_id_or_raise(process_instance_id, load_columns=(ProcessInstanceModel.id,))
     query = db.session.query(TaskDefinitionModel.typename).distinct()  # type: ignore
     task_types = [t.typename for t in query]
     event_types = ProcessInstanceEventType.list()
@@ -170,7 +171,7 @@ def process_instance_migration_event_list(
     modified_process_model_identifier: str,
     process_instance_id: int,
 ) -> flask.wrappers.Response:
-    process_instance = _find_process_instance_by_id_or_raise(process_instance_id)
+    process_instance = _find_process_instance_by_id_or_raise(process_instance_id, load_columns=(ProcessInstanceModel.id,))
 
     logs = (
         db.session.query(ProcessInstanceEventModel, ProcessInstanceMigrationDetailModel, UserModel)
@@ -47,6 +47,7 @@ from spiffworkflow_backend.models.task_draft_data import TaskDraftDataDict
 from spiffworkflow_backend.models.task_draft_data import TaskDraftDataModel
 from spiffworkflow_backend.models.task_instructions_for_end_user import TaskInstructionsForEndUserModel
 from spiffworkflow_backend.models.user import UserModel
+from spiffworkflow_backend.routes.process_api_blueprint import _ensure_principal_exists_or_raise
 from spiffworkflow_backend.routes.process_api_blueprint import _find_principal_or_raise
 from spiffworkflow_backend.routes.process_api_blueprint import _find_process_instance_by_id_or_raise
 from spiffworkflow_backend.routes.process_api_blueprint import _find_process_instance_for_me_or_raise
@@ -79,7 +80,7 @@ def task_allows_guest(
 
 # this is currently not used by the Frontend
 def task_list_my_tasks(process_instance_id: int | None = None, page: int = 1, per_page: int = 100) -> flask.wrappers.Response:
-    principal = _find_principal_or_raise()
+    _ensure_principal_exists_or_raise()
     assigned_user = aliased(UserModel)
     process_initiator_user = aliased(UserModel)
     human_task_query = (
@@ -97,7 +98,7 @@ def task_list_my_tasks(process_instance_id: int | None = None, page: int = 1, pe
             HumanTaskUserModel,
             HumanTaskUserModel.human_task_id == HumanTaskModel.id,
         )
-        .filter(HumanTaskUserModel.user_id == principal.user_id)
+        .filter(HumanTaskUserModel.user_id == g.user.id)
         .outerjoin(assigned_user, assigned_user.id == HumanTaskUserModel.user_id)
         .filter(HumanTaskModel.completed == False)  # noqa: E712
         .outerjoin(GroupModel, GroupModel.id == HumanTaskModel.lane_assignment_id)
@@ -457,8 +458,8 @@ def process_instance_progress(
     response: dict[str, Task | ProcessInstanceModel | list | dict[str, str]] = {}
     process_instance = _find_process_instance_for_me_or_raise(process_instance_id, include_actions=True)
 
-    principal = _find_principal_or_raise()
-    next_human_task_assigned_to_me = TaskService.next_human_task_for_user(process_instance_id, principal.user_id)
+    _ensure_principal_exists_or_raise()
+    next_human_task_assigned_to_me = TaskService.next_human_task_for_user(process_instance_id, g.user.id)
     if next_human_task_assigned_to_me:
         response["task"] = HumanTaskModel.to_task(next_human_task_assigned_to_me)
     # this may not catch all times we should redirect to instance show page
@@ -7,7 +7,10 @@ from flask import jsonify
 from flask import make_response
 
 from spiffworkflow_backend.exceptions.api_error import ApiError
+from spiffworkflow_backend.models.db import db
+from spiffworkflow_backend.models.group import GroupModel
 from spiffworkflow_backend.models.user import UserModel
+from spiffworkflow_backend.models.user_group_assignment import UserGroupAssignmentModel
 
 
 def user_exists_by_username(body: dict[str, Any]) -> flask.wrappers.Response:
@@ -33,9 +36,16 @@ def user_search(username_prefix: str) -> flask.wrappers.Response:
 
 
 def user_group_list_for_current_user() -> flask.wrappers.Response:
-    groups = g.user.groups
     # TODO: filter out the default group and have a way to know what is the default group
-    group_identifiers = [
-        i.identifier for i in groups if i.identifier != current_app.config["SPIFFWORKFLOW_BACKEND_DEFAULT_USER_GROUP"]
-    ]
-    return make_response(jsonify(sorted(group_identifiers)), 200)
+    group_identifier_rows = (
+        db.session.query(GroupModel.identifier)
+        .join(UserGroupAssignmentModel, UserGroupAssignmentModel.group_id == GroupModel.id)
+        .filter(
+            UserGroupAssignmentModel.user_id == g.user.id,
+            GroupModel.identifier != current_app.config["SPIFFWORKFLOW_BACKEND_DEFAULT_USER_GROUP"],
+        )
+        .all()
+    )
+    # sort in python rather than the db so the order does not depend on the db collation
+    group_identifiers = sorted(identifier for (identifier,) in group_identifier_rows)
+    return make_response(jsonify(group_identifiers), 200)
@@ -479,9 +479,10 @@ class AuthenticationService:
                 "unauthorized",
             )
 
-        received_sign = auth_header.split("sha256=")[-1].strip()
+        # compare bytes since compare_digest raises a TypeError rather than returning False for non-ascii str
+        received_sign = auth_header.split("sha256=")[-1].strip().encode()
         secret = current_app.config["SPIFFWORKFLOW_BACKEND_GITHUB_WEBHOOK_SECRET"].encode()
-        expected_sign = HMAC(key=secret, msg=request.data, digestmod=sha256).hexdigest()
+        expected_sign = HMAC(key=secret, msg=request.get_data(cache=True), digestmod=sha256).hexdigest().encode()
         if not compare_digest(received_sign, expected_sign):
             raise TokenInvalidError(
                 "unauthorized",
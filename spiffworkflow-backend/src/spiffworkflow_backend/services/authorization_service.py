@@ -1,5 +1,4 @@
 import inspect
-import re
 from dataclasses import dataclass
 from typing import Any
 
@@ -12,6 +11,8 @@ from sqlalchemy import and_
 from sqlalchemy import func
 from sqlalchemy import literal
 from sqlalchemy import or_
+from sqlalchemy import select
+from sqlalchemy.orm import aliased
 
 from spiffworkflow_backend.exceptions.error import HumanTaskAlreadyCompletedError
 from spiffworkflow_backend.exceptions.error import HumanTaskNotFoundError
@@ -28,8 +29,10 @@ from spiffworkflow_backend.models.db import db
 from spiffworkflow_backend.models.group import SPIFF_GUEST_GROUP
 from spiffworkflow_backend.models.group import GroupModel
 from spiffworkflow_backend.models.human_task import HumanTaskModel
+from spiffworkflow_backend.models.permission_assignment import Permission
 from spiffworkflow_backend.models.permission_assignment import PermissionAssignmentModel
 from spiffworkflow_backend.models.permission_target import PermissionTargetModel
+from spiffworkflow_backend.models.principal import MissingPrincipalError
 from spiffworkflow_backend.models.principal import PrincipalModel
 from spiffworkflow_backend.models.process_model import ProcessModelInfo
 from spiffworkflow_backend.models.service_account import SPIFF_SERVICE_ACCOUNT_AUTH_SERVICE
@@ -82,6 +85,14 @@ PATH_SEGMENTS_FOR_PERMISSION_ALL = [
     {"path": "/task-data", "relevant_permissions": ["read", "update"]},
 ]
 
+# the permission needed to make a request with each http method. permission assignments cannot grant other methods.
+PERMISSIONS_BY_HTTP_METHOD = {
+    "POST": "create",
+    "GET": "read",
+    "PUT": "update",
+    "DELETE": "delete",
+}
+
 # these are api calls that are allowed to generate a public jwt when called
 PUBLIC_AUTHENTICATION_EXCLUSION_LIST = [
     "spiffworkflow_backend.routes.public_controller.form_show",
@@ -135,8 +146,30 @@ class AuthorizationService:
 
     @classmethod
     def all_permission_assignments_for_user(cls, user: UserModel) -> list[PermissionAssignmentModel]:
-        principals = UserService.all_principals_for_user(user)
-        principal_ids = [p.id for p in principals]
+        # resolve the user's principal and the principals of all of their groups in one query rather than
+        # lazy loading user.principal and each group.principal. there is one row per group the user is in.
+        user_principal = aliased(PrincipalModel)
+        group_principal = aliased(PrincipalModel)
+        principal_rows = db.session.execute(
+            select(user_principal.id, UserGroupAssignmentModel.group_id, group_principal.id)
+            .select_from(UserModel)
+            .outerjoin(user_principal, user_principal.user_id == UserModel.id)
+            .outerjoin(UserGroupAssignmentModel, UserGroupAssignmentModel.user_id == UserModel.id)
+            .outerjoin(group_principal, group_principal.group_id == UserGroupAssignmentModel.group_id)
+            .where(UserModel.id == user.id)
+        ).all()
+
+        # same data integrity checks as UserService.all_principals_for_user
+        if len(principal_rows) == 0 or principal_rows[0][0] is None:
+            raise MissingPrincipalError(f"Missing principal for user with id: {user.id}")
+        principal_ids = [principal_rows[0][0]]
+        for _user_principal_id, group_id, group_principal_id in principal_rows:
+            if group_id is None:
+                continue
+            if group_principal_id is None:
+                raise MissingPrincipalError(f"Missing principal for group with id: {group_id}")
+            principal_ids.append(group_principal_id)
+
         permission_assignments: list[PermissionAssignmentModel] = (
             PermissionAssignmentModel.query.filter(PermissionAssignmentModel.principal_id.in_(principal_ids))
             .options(db.joinedload(PermissionAssignmentModel.permission_target))
@@ -144,13 +177,45 @@ class AuthorizationService:
         )
         return permission_assignments
 
+    @classmethod
+    def permission_assignments_by_permission(
+        cls, permission_assignments: list[PermissionAssignmentModel]
+    ) -> dict[str, list[PermissionAssignmentModel]]:
+        permission_assignments_by_permission: dict[str, list[PermissionAssignmentModel]] = {}
+        for permission_assignment in permission_assignments:
+            permission_assignments_by_permission.setdefault(permission_assignment.permission, []).append(permission_assignment)
+        return permission_assignments_by_permission
+
+    # true if the assignments permit every permission on every uri and deny nothing, like a super admin.
+    # in that case every permission check will pass so callers can skip matching individual uris.
+    @classmethod
+    def permission_assignments_grant_everything(cls, permission_assignments: list[PermissionAssignmentModel]) -> bool:
+        permissions_granted_on_all_uris = set()
+        for permission_assignment in permission_assignments:
+            if permission_assignment.grant_type == "deny":
+                return False
+            if permission_assignment.permission_target.uri == PermissionTargetModel.URI_ALL:
+                permissions_granted_on_all_uris.add(permission_assignment.permission)
+        return permissions_granted_on_all_uris.issuperset(p.value for p in Permission)
+
+    @classmethod
+    def normalize_target_uri(cls, target_uri: str) -> str:
+        uri_with_percent = target_uri.replace("*", "%")
+        return uri_with_percent.removeprefix(V1_API_PATH_PREFIX)
+
     @classmethod
     def permission_assignments_include(
         cls, permission_assignments: list[PermissionAssignmentModel], permission: str, target_uri: str
     ) -> bool:
-        uri_with_percent = re.sub(r"\*", "%", target_uri)
-        target_uri_normalized = uri_with_percent.removeprefix(V1_API_PATH_PREFIX)
+        return cls.permission_assignments_include_normalized_uri(
+            permission_assignments, permission, cls.normalize_target_uri(target_uri)
+        )
 
+    # use this when checking the same uri more than once so it only needs to be normalized once
+    @classmethod
+    def permission_assignments_include_normalized_uri(
+        cls, permission_assignments: list[PermissionAssignmentModel], permission: str, target_uri_normalized: str
+    ) -> bool:
         matching_permission_assignments = []
         for permission_assignment in permission_assignments:
             if permission_assignment.permission == permission and cls.target_uri_matches_actual_uri(
@@ -237,8 +302,7 @@ class AuthorizationService:
 
     @classmethod
     def find_or_create_permission_target(cls, uri: str) -> PermissionTargetModel:
-        uri_with_percent = re.sub(r"\*", "%", uri)
-        target_uri_normalized = uri_with_percent.removeprefix(V1_API_PATH_PREFIX)
+        target_uri_normalized = cls.normalize_target_uri(uri)
         permission_target: PermissionTargetModel | None = PermissionTargetModel.query.filter_by(uri=target_uri_normalized).first()
         if permission_target is None:
             permission_target = PermissionTargetModel(uri=target_uri_normalized)
@@ -336,16 +400,7 @@ class AuthorizationService:
 
     @classmethod
     def get_permission_from_http_method(cls, http_method: str) -> str | None:
-        request_method_mapper = {
-            "POST": "create",
-            "GET": "read",
-            "PUT": "update",
-            "DELETE": "delete",
-        }
-        if http_method in request_method_mapper:
-            return request_method_mapper[http_method]
-
-        return None
+        return PERMISSIONS_BY_HTTP_METHOD.get(http_method)
 
     @classmethod
     def check_permission_for_request(cls) -> None:
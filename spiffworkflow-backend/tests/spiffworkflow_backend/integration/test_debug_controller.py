@@ -1,5 +1,8 @@
 from flask.app import Flask
 from flask.testing import FlaskClient
+from pytest_mock.plugin import MockerFixture
+from spiffworkflow_backend.models.user import UserModel
+from spiffworkflow_backend.routes.debug_controller import _version_info_json
 
 from tests.spiffworkflow_backend.helpers.base_test import BaseTest
 
@@ -15,3 +18,33 @@ class TestDebugController(BaseTest):
             "/v1.0/debug/test-raise-error",
         )
         assert response.status_code == 500
+
+    def test_version_info(
+        self,
+        app: Flask,
+        mocker: MockerFixture,
+        client: FlaskClient,
+        with_db_and_bpmn_file_cleanup: None,
+        with_super_admin_user: UserModel,
+    ) -> None:
+        version_info_data = {"version": "1.2.3", "git_commit": "abc123"}
+        get_version_info_data_mock = mocker.patch(
+            "spiffworkflow_backend.routes.debug_controller.get_version_info_data",
+            return_value=version_info_data,
+        )
+        # the payload is cached for the life of the process so make sure other tests do not leak into this one
+        _version_info_json.cache_clear()
+        try:
+            for _ in range(2):
+                response = client.get(
+                    "/v1.0/debug/version-info",
+                    headers=self.logged_in_headers(with_super_admin_user),
+                )
+                assert response.status_code == 200
+                assert response.mimetype == "application/json"
+                assert response.json == version_info_data
+
+            assert get_version_info_data_mock.call_count == 1
+            assert _version_info_json.cache_info().hits == 1
+        finally:
+            _version_info_json.cache_clear()
@@ -142,6 +142,75 @@ class TestProcessApi(BaseTest):
         assert response.json is not None
         assert response.json == expected_response_body
 
+    def test_permissions_check_for_user_with_all_permissions(
+        self,
+        app: Flask,
+        client: FlaskClient,
+        with_db_and_bpmn_file_cleanup: None,
+    ) -> None:
+        user = self.create_user_with_permission("super_admin")
+        request_body = {
+            "requests_to_check": {
+                "/v1.0/process-groups": ["GET", "POST"],
+                "/v1.0/process-models": ["GET", "DELETE"],
+            }
+        }
+        expected_response_body = {
+            "results": {
+                "/v1.0/process-groups": {"GET": True, "POST": True},
+                "/v1.0/process-models": {"GET": True, "DELETE": True},
+            }
+        }
+        response = client.post(
+            "/v1.0/permissions-check",
+            headers=self.logged_in_headers(user),
+            content_type="application/json",
+            data=json.dumps(request_body),
+        )
+        assert response.status_code == 200
+        assert response.json == expected_response_body
+
+        # a single deny means we can no longer assume the user can do everything
+        self.add_permissions_to_user(user, target_uri="/v1.0/process-models", permission_names=["delete"], grant_type="deny")
+        expected_response_body["results"]["/v1.0/process-models"]["DELETE"] = False
+        response = client.post(
+            "/v1.0/permissions-check",
+            headers=self.logged_in_headers(user),
+            content_type="application/json",
+            data=json.dumps(request_body),
+        )
+        assert response.status_code == 200
+        assert response.json == expected_response_body
+
+    def test_permissions_check_with_duplicate_and_invalid_methods(
+        self,
+        app: Flask,
+        client: FlaskClient,
+        with_db_and_bpmn_file_cleanup: None,
+    ) -> None:
+        user = self.find_or_create_user()
+        self.add_permissions_to_user(user, target_uri="/v1.0/process-groups", permission_names=["read"])
+        request_body = {"requests_to_check": {"/v1.0/process-groups": ["GET", "GET", "PATCH", "POST"]}}
+        response = client.post(
+            "/v1.0/permissions-check",
+            headers=self.logged_in_headers(user),
+            content_type="application/json",
+            data=json.dumps(request_body),
+        )
+        assert response.status_code == 200
+        assert response.json == {"results": {"/v1.0/process-groups": {"GET": True, "POST": False}}}
+
+        for requests_to_check in [["/v1.0/process-groups"], {"/v1.0/process-groups": "GET"}, {"/v1.0/process-groups": [["GET"]]}]:
+            response = client.post(
+                "/v1.0/permissions-check",
+                headers=self.logged_in_headers(user),
+                content_type="application/json",
+                data=json.dumps({"requests_to_check": requests_to_check}),
+            )
+            assert response.status_code == 400
+            assert response.json is not None
+            assert response.json["error_code"] == "invalid_requests_to_check"
+
     def test_process_model_create(
         self,
         app: Flask,
@@ -3201,6 +3270,19 @@ class TestProcessApi(BaseTest):
         assert response.json is not None
         assert response.json["process_data_value"] == "hey"
 
+        # the bpmn process data itself is missing
+        bpmn_process = process_instance_one.bpmn_process
+        bpmn_process.json_data_hash = "hash_with_no_json_data"
+        db.session.add(bpmn_process)
+        db.session.commit()
+        response = client.get(
+            f"/v1.0/process-data/the_cat/{self.modify_process_identifier_for_path_param(process_model.id)}/the_data_object_var/{process_instance_one.id}",
+            headers=self.logged_in_headers(with_super_admin_user),
+        )
+        assert response.status_code == 404
+        assert response.json is not None
+        assert response.json["error_code"] == "bpmn_process_data_not_found"
+
     def test_process_data_show_with_sub_process(
         self,
         app: Flask,
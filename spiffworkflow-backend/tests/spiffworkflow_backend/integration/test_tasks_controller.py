@@ -1,8 +1,11 @@
 import json
 from uuid import UUID
 
+import pytest
+from flask import g
 from flask.app import Flask
 from flask.testing import FlaskClient
+from spiffworkflow_backend.exceptions.api_error import ApiError
 from spiffworkflow_backend.models.db import db
 from spiffworkflow_backend.models.group import GroupModel
 from spiffworkflow_backend.models.human_task import HumanTaskModel
@@ -10,6 +13,7 @@ from spiffworkflow_backend.models.process_instance import ProcessInstanceModel
 from spiffworkflow_backend.models.process_instance import ProcessInstanceStatus
 from spiffworkflow_backend.models.task import TaskModel
 from spiffworkflow_backend.models.user import UserModel
+from spiffworkflow_backend.routes.process_api_blueprint import _ensure_principal_exists_or_raise
 from spiffworkflow_backend.routes.tasks_controller import _dequeued_interstitial_stream
 from spiffworkflow_backend.services.authorization_service import AuthorizationService
 from spiffworkflow_backend.services.process_instance_processor import ProcessInstanceProcessor
@@ -514,3 +518,20 @@ class TestTasksController(BaseTest):
         assert response.content_type == "application/json"
         assert isinstance(response.json, list)
         assert len(response.json) == 1
+
+    def test_ensure_principal_exists_or_raise(
+        self,
+        app: Flask,
+        client: FlaskClient,
+        with_db_and_bpmn_file_cleanup: None,
+    ) -> None:
+        user = self.find_or_create_user()
+        g.user = user
+        _ensure_principal_exists_or_raise()
+
+        db.session.delete(user.principal)
+        db.session.commit()
+        with pytest.raises(ApiError) as exception:
+            _ensure_principal_exists_or_raise()
+        assert exception.value.error_code == "principal_not_found"
+        assert exception.value.status_code == 400
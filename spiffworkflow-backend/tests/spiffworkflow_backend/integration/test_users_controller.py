@@ -1,6 +1,7 @@
 from flask.app import Flask
 from flask.testing import FlaskClient
 from spiffworkflow_backend.models.user import UserModel
+from spiffworkflow_backend.services.user_service import UserService
 
 from tests.spiffworkflow_backend.helpers.base_test import BaseTest
 
@@ -24,6 +25,27 @@ class TestUsersController(BaseTest):
         self._assert_search_has_count(client, with_super_admin_user, "ad", 0)
         self._assert_search_has_count(client, with_super_admin_user, "a", 4)
 
+    def test_user_group_list_for_current_user_excludes_default_group(
+        self,
+        app: Flask,
+        client: FlaskClient,
+        with_db_and_bpmn_file_cleanup: None,
+        with_super_admin_user: UserModel,
+    ) -> None:
+        for group_identifier in ["group_b", "group_a", app.config["SPIFFWORKFLOW_BACKEND_DEFAULT_USER_GROUP"]]:
+            group = UserService.find_or_create_group(group_identifier)
+            UserService.add_user_to_group(with_super_admin_user, group)
+
+        response = client.get(
+            "/v1.0/user-groups/for-current-user",
+            headers=self.logged_in_headers(with_super_admin_user),
+        )
+        assert response.status_code == 200
+        assert response.json is not None
+        assert "group_a" in response.json
+        assert app.config["SPIFFWORKFLOW_BACKEND_DEFAULT_USER_GROUP"] not in response.json
+        assert response.json == sorted(response.json)
+
     def _assert_search_has_count(
         self,
         client: FlaskClient,
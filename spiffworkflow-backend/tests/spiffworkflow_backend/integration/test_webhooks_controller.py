@@ -31,6 +31,21 @@ class TestWebhooksController(BaseTest):
         )
         assert response.status_code == 200
 
+    def test_webhook_rejects_invalid_signatures(
+        self,
+        app: Flask,
+        client: FlaskClient,
+        with_db_and_bpmn_file_cleanup: None,
+    ) -> None:
+        request_data = json.dumps({"body": "THIS IS OUR REQEST"})
+        for encoded_signature in ["not_the_signature", "n\u00f6t_the_signature"]:
+            response = client.post(
+                "/v1.0/webhook",
+                headers={"X-Hub-Signature-256": f"sha256={encoded_signature}", "Content-type": "application/json"},
+                data=request_data,
+            )
+            assert response.status_code == 403
+
     def _create_encoded_signature(self, app: FlaskApp, request_data: str) -> str:
         secret = app.config["SPIFFWORKFLOW_BACKEND_GITHUB_WEBHOOK_SECRET"].encode()
         return HMAC(key=secret, msg=request_data.encode(), digestmod=sha256).hexdigest()
@@ -2,9 +2,11 @@ import pytest
 from flask import Flask
 from flask.testing import FlaskClient
 from spiffworkflow_backend.exceptions.error import InvalidPermissionError
+from spiffworkflow_backend.models.db import db
 from spiffworkflow_backend.models.group import GroupModel
 from spiffworkflow_backend.models.human_task import HumanTaskModel
 from spiffworkflow_backend.models.human_task_user import HumanTaskUserModel
+from spiffworkflow_backend.models.principal import MissingPrincipalError
 from spiffworkflow_backend.models.user_group_assignment_waiting import UserGroupAssignmentWaitingModel
 from spiffworkflow_backend.services.authorization_service import AuthorizationService
 from spiffworkflow_backend.services.authorization_service import GroupPermissionsDict
@@ -491,6 +493,33 @@ class TestAuthorizationService(BaseTest):
         # no match, since prefix doesn't match. wildcard isn't that magical.
         assert AuthorizationService.target_uri_matches_actual_uri("/process-groups/%", "/process-models") is False
 
+    def test_normalize_target_uri(self, app: Flask, with_db_and_bpmn_file_cleanup: None) -> None:
+        assert AuthorizationService.normalize_target_uri("/v1.0/process-groups/hey") == "/process-groups/hey"
+        assert AuthorizationService.normalize_target_uri("/v1.0/process-groups/*") == "/process-groups/%"
+        assert AuthorizationService.normalize_target_uri("/process-groups/hey:*") == "/process-groups/hey:%"
+
+    def test_all_permission_assignments_for_user_includes_group_permissions(
+        self, app: Flask, with_db_and_bpmn_file_cleanup: None
+    ) -> None:
+        user = self.find_or_create_user()
+        self.add_permissions_to_user(user, target_uri="/v1.0/process-groups", permission_names=["read"])
+        group = UserService.find_or_create_group("test_group")
+        UserService.add_user_to_group(user, group)
+        self.add_permissions_to_principal(group.principal, target_uri="/v1.0/process-models/%", permission_names=["create"])
+
+        permission_assignments = AuthorizationService.all_permission_assignments_for_user(user)
+        permissions_and_uris = [(pa.permission, pa.permission_target.uri) for pa in permission_assignments]
+        assert ("read", "/process-groups") in permissions_and_uris
+        assert ("create", "/process-models/%") in permissions_and_uris
+
+        # a group without a principal is a data integrity problem, just like in UserService.all_principals_for_user
+        group_without_principal = GroupModel(identifier="group_without_principal")
+        db.session.add(group_without_principal)
+        db.session.commit()
+        UserService.add_user_to_group(user, group_without_principal)
+        with pytest.raises(MissingPrincipalError):
+            AuthorizationService.all_permission_assignments_for_user(user)
+
     def _expected_basic_permissions(self) -> list[tuple[str, str]]:
         return sorted(
             [
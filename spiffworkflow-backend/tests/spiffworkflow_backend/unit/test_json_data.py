@@ -0,0 +1,19 @@
+from flask.app import Flask
+from spiffworkflow_backend.models.db import db
+from spiffworkflow_backend.models.json_data import JsonDataModel
+
+from tests.spiffworkflow_backend.helpers.base_test import BaseTest
+
+
+class TestJsonData(BaseTest):
+    def test_find_data_value_by_hash(self, app: Flask, with_db_and_bpmn_file_cleanup: None) -> None:
+        data = {"data_objects": {"the_var": "hey", 'a,b"{}': "unsafe", "a": {"b": "nested"}}}
+        json_data_hash = JsonDataModel.create_and_insert_json_data_from_dict(data)
+        db.session.commit()
+
+        assert JsonDataModel.find_data_value_by_hash(json_data_hash, ("data_objects", "the_var")) == "hey"
+        assert JsonDataModel.find_data_value_by_hash(json_data_hash, ("data_objects", "missing")) is None
+
+        # keys that cannot go in a json path are still looked up exactly rather than reading a nested key
+        assert JsonDataModel.find_data_value_by_hash(json_data_hash, ("data_objects", 'a,b"{}')) == "unsafe"
+        assert JsonDataModel.find_data_value_by_hash(json_data_hash, ("data_objects", "a,b")) is None